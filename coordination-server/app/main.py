@@ -5,7 +5,7 @@ from contextlib import asynccontextmanager
 import logging
 
 from .config import settings
-from .database import connect_to_mongodb, close_mongodb_connection
+from .database import connect_to_mongodb, close_mongodb_connection, get_database
 from .routers import vaults, guardians, transactions
 from .websocket import signing_protocol
 
@@ -107,31 +107,51 @@ async def connect(sid, environ, auth):
     """Handle guardian connection"""
     logger.info(f"Guardian connecting: {sid}")
 
-    # Extract auth data
+    # Extract auth data. A client may multiplex several guardians over one
+    # connection by sending guardianIds instead of a single guardianId
     vault_id = auth.get("vaultId") if auth else None
-    guardian_id = auth.get("guardianId") if auth else None
+    guardian_ids = auth.get("guardianIds") if auth else None
+    if not guardian_ids and auth and auth.get("guardianId"):
+        guardian_ids = [auth["guardianId"]]
 
-    if not vault_id or not guardian_id:
+    if not vault_id or not guardian_ids:
         logger.warning(f"Connection rejected: missing auth data")
         return False  # Reject connection
 
+    if not isinstance(guardian_ids, list) or not all(
+        isinstance(guardian_id, str) and guardian_id for guardian_id in guardian_ids
+    ):
+        logger.warning(f"Connection rejected: guardianIds must be a list of strings")
+        return False
+
+    # Every guardian acted for must belong to the vault
+    guardian_ids = list(dict.fromkeys(guardian_ids))
+    db = get_database()
+    members = await db.guardians.count_documents(
+        {"vault_id": vault_id, "guardian_id": {"$in": guardian_ids}}
+    )
+    if members != len(guardian_ids):
+        logger.warning(f"Connection rejected: guardians not in vault {vault_id}")
+        return False
+
     # Store session data
     async with sio.session(sid) as session:
         session["vault_id"] = vault_id
-        session["guardian_id"] = guardian_id
+        session["guardian_ids"] = guardian_ids
 
     # Join vault room
     await sio.enter_room(sid, f"vault_{vault_id}")
 
-    logger.info(f"Guardian {guardian_id} connected to vault {vault_id}")
+    for guardian_id in guardian_ids:
+        logger.info(f"Guardian {guardian_id} connected to vault {vault_id}")
 
-    # Notify other guardians in the vault
-    await sio.emit(
-        "guardian:connected",
-        {"guardian_id": guardian_id},
-        room=f"vault_{vault_id}",
-        skip_sid=sid,
-    )
+        # Notify other guardians in the vault
+        await sio.emit(
+            "guardian:connected",
+            {"guardian_id": guardian_id},
+            room=f"vault_{vault_id}",
+            skip_sid=sid,
+        )
 
     return True  # Accept connection
 
@@ -142,17 +162,18 @@ async def disconnect(sid):
     try:
         async with sio.session(sid) as session:
             vault_id = session.get("vault_id")
-            guardian_id = session.get("guardian_id")
-
-        if vault_id and guardian_id:
-            logger.info(f"Guardian {guardian_id} disconnected from vault {vault_id}")
-
-            # Notify other guardians
-            await sio.emit(
-                "guardian:disconnected",
-                {"guardian_id": guardian_id},
-                room=f"vault_{vault_id}",
-            )
+            guardian_ids = session.get("guardian_ids", [])
+
+        if vault_id:
+            for guardian_id in guardian_ids:
+                logger.info(f"Guardian {guardian_id} disconnected from vault {vault_id}")
+
+                # Notify other guardians
+                await sio.emit(
+                    "guardian:disconnected",
+                    {"guardian_id": guardian_id},
+                    room=f"vault_{vault_id}",
+                )
     except Exception as e:
         logger.error(f"Error handling disconnect: {e}")
 
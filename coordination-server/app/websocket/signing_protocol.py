@@ -22,8 +22,8 @@ def register_handlers(sio):
         {
             "transactionId": "tx_...",
             "guardianId": "guard_...",
-            "nonceShare": "hex string",
-            "rPoint": "hex string (compressed public key)"
+            "nonceShare": bytes or hex string,
+            "rPoint": bytes or hex string (compressed public key)
         }
         """
         try:
@@ -37,10 +37,16 @@ def register_handlers(sio):
             if not all([transaction_id, guardian_id, nonce_share, r_point]):
                 return {"success": False, "error": "Missing required fields"}
 
+            # Clients may send raw bytes (Socket.IO binary attachments);
+            # round data is stored as hex either way
+            if isinstance(nonce_share, bytes):
+                nonce_share = nonce_share.hex()
+            if isinstance(r_point, bytes):
+                r_point = r_point.hex()
+
             # Verify guardian is in session
             async with sio.session(sid) as session:
-                session_guardian_id = session.get("guardian_id")
-                if session_guardian_id != guardian_id:
+                if guardian_id not in session.get("guardian_ids", []):
                     return {"success": False, "error": "Guardian ID mismatch"}
 
             logger.info(f"Received Round 1 from {guardian_id} for {transaction_id}")
@@ -105,8 +111,7 @@ def register_handlers(sio):
 
             # Verify guardian
             async with sio.session(sid) as session:
-                session_guardian_id = session.get("guardian_id")
-                if session_guardian_id != guardian_id:
+                if guardian_id not in session.get("guardian_ids", []):
                     return {"success": False, "error": "Guardian ID mismatch"}
 
             logger.info(f"Guardian {guardian_id} requesting Round 2 data for {transaction_id}")
@@ -158,8 +163,7 @@ def register_handlers(sio):
 
             # Verify guardian
             async with sio.session(sid) as session:
-                session_guardian_id = session.get("guardian_id")
-                if session_guardian_id != guardian_id:
+                if guardian_id not in session.get("guardian_ids", []):
                     return {"success": False, "error": "Guardian ID mismatch"}
 
             logger.info(f"Received Round 3 from {guardian_id} for {transaction_id}")
@@ -239,8 +243,7 @@ def register_handlers(sio):
 
             # Verify guardian
             async with sio.session(sid) as session:
-                session_guardian_id = session.get("guardian_id")
-                if session_guardian_id != guardian_id:
+                if guardian_id not in session.get("guardian_ids", []):
                     return {"success": False, "error": "Guardian ID mismatch"}
 
             logger.info(f"Guardian {guardian_id} requesting final signature for {transaction_id}")
@@ -21,7 +21,7 @@ from guardianvault.mpc_keymanager import (
     ExtendedPublicKey,
     KeyShare
 )
-from guardianvault.mpc_addresses import BitcoinAddressGenerator
+from guardianvault.mpc_addresses import AddressRecord, BitcoinAddressGenerator
 from guardianvault.mpc_signing import MPCSigningWorkflow
 from guardianvault.bitcoin_transaction import BitcoinTransactionBuilder
 
@@ -150,7 +150,7 @@ class BitcoinRPCClient:
         return self.call("gettxout", [txid, vout, include_mempool])
 
 
-def setup_mpc_and_generate_address() -> Tuple[List[KeyShare], ExtendedPublicKey, Dict]:
+def setup_mpc_and_generate_address() -> Tuple[List[KeyShare], ExtendedPublicKey, AddressRecord]:
     """
     Phase 1: MPC Setup and Address Generation
     Returns: (bitcoin_shares, btc_xpub, first_address)
@@ -213,15 +213,16 @@ def setup_mpc_and_generate_address() -> Tuple[List[KeyShare], ExtendedPublicKey,
         account_pubkey, network="regtest"
     )
 
-    first_address = {
-        'path': "m/44'/0'/0'",
-        'address': first_address_info,
-        'public_key': account_pubkey.hex()
-    }
+    first_address = AddressRecord(
+        path="m/44'/0'/0'",
+        public_key=account_pubkey,
+        address=first_address_info,
+        address_type="p2pkh"
+    )
 
     print(f"Path: {first_address['path']}")
     print(f"Address: {first_address['address']}")
-    print(f"Public Key: {first_address['public_key'][:32]}...")
+    print(f"Public Key: {first_address.public_key_hex[:32]}...")
     print()
 
     return btc_account_shares, btc_xpub, first_address
@@ -282,7 +283,7 @@ def fund_address_from_regtest(rpc: BitcoinRPCClient, address: str, amount: float
 def create_and_sign_transaction(
     rpc: BitcoinRPCClient,
     btc_account_shares: List[KeyShare],
-    address_info: Dict,
+    address_info: AddressRecord,
     funding_txid: str,
     recipient_address: str,
     amount: float = 0.5
@@ -361,7 +362,7 @@ def create_and_sign_transaction(
     print("  Each party signs with their share, then signatures are combined")
     print()
 
-    public_key = bytes.fromhex(address_info['public_key'])
+    public_key = address_info.public_key
 
     print("  Executing distributed threshold signing...")
     signature = MPCSigningWorkflow.sign_message(
@@ -258,7 +258,7 @@ def simulate_transaction_signing(parties: List[MPCParty], address_info: Dict):
 
     # Get public key for the address
     # (In real implementation, derive from path)
-    public_key = bytes.fromhex(address_info['public_key'])
+    public_key = address_info['public_key']
 
     # Sign using threshold protocol
     print("Executing threshold signing protocol...")
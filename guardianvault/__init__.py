@@ -22,7 +22,7 @@ from .mpc_signing import (
     ThresholdSignature,
     KeyShare as SigningKeyShare,
 )
-from .mpc_addresses import BitcoinAddressGenerator, EthereumAddressGenerator
+from .mpc_addresses import AddressRecord, BitcoinAddressGenerator, EthereumAddressGenerator
 
 # Backwards compatibility aliases (deprecated - will be removed in future versions)
 ThresholdKeyGeneration = MPCKeyGeneration
@@ -45,6 +45,7 @@ __all__ = [
     "ThresholdSignature",
     "BitcoinAddressGenerator",
     "EthereumAddressGenerator",
+    "AddressRecord",
     "SECP256K1_N",
     "SECP256K1_P",
     # Backwards compatibility (deprecated)
@@ -215,18 +215,17 @@ class EthereumAddress:
             import hashlib
             hash_bytes = hashlib.sha3_256(address.encode('utf-8')).digest()
         
-        hash_hex = hash_bytes.hex()
-        
-        # Apply checksum
-        checksummed = '0x'
-        for i, char in enumerate(address):
-            if char in '0123456789':
-                checksummed += char
-            else:
-                # Uppercase if hash digit >= 8
-                checksummed += char.upper() if int(hash_hex[i], 16) >= 8 else char
-        
-        return checksummed
+        # Apply checksum in place on the ASCII bytes; character i takes the
+        # high (even i) or low (odd i) nibble of hash byte i // 2
+        checksummed = bytearray(address, 'ascii')
+        for i, char in enumerate(checksummed):
+            byte = hash_bytes[i >> 1]
+            nibble = byte & 0x0F if i & 1 else byte >> 4
+            # Uppercase letters ('a'-'f') if hash digit >= 8
+            if char >= 0x61 and nibble >= 8:
+                checksummed[i] = char - 0x20
+        
+        return '0x' + checksummed.decode('ascii')
     
     @classmethod
     def generate_address(cls, private_key: bytes) -> Tuple[str, str]:
@@ -5,13 +5,240 @@ Works with mpc_keymanager.py for TRUE MPC (no private key reconstruction)
 """
 
 import hashlib
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
 from .mpc_keymanager import (
     ExtendedPublicKey,
     PublicKeyDerivation,
     EllipticCurvePoint
 )
 
+try:
+    # Rust Base58 encoder (includes the leading '1' padding); the _check
+    # variant also computes the double-SHA256 checksum natively
+    from based58 import b58encode as _b58encode, b58encode_check as _b58encode_check
+except ImportError:
+    # Fall back to the pure-Python encoder in _base58_encode
+    _b58encode = _b58encode_check = None
+
+try:
+    # libsecp256k1 bindings: native point decompression for Ethereum addresses
+    from coincurve import PublicKey as _SecpPublicKey
+except ImportError:
+    # Fall back to EllipticCurvePoint.from_bytes
+    _SecpPublicKey = None
+
+try:
+    # pycryptodome's C Keccak, without the eth_hash dispatch layer; its
+    # RIPEMD160 covers OpenSSL builds that no longer provide one
+    from Crypto.Hash import keccak as _keccak_mod, RIPEMD160 as _RIPEMD160_mod
+except ImportError:
+    _keccak_mod = _RIPEMD160_mod = None
+
+BASE58_ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+
+# EIP-55 lookup table: hex digit of the address hash -> case bit to flip
+# (0x20 for digits 8-f, whose nibble has the high bit set; 0x00 otherwise)
+_EIP55_CASE_BITS = bytes.maketrans(b'0123456789abcdef', b'\x00' * 8 + b'\x20' * 8)
+
+# P2PKH version byte per network (0x00 for mainnet, 0x6f for testnet/regtest)
+_P2PKH_VERSION = {'mainnet': b'\x00', 'testnet': b'\x6f', 'regtest': b'\x6f'}
+
+# Hash backends, bound once at import so the per-address code never picks
+# an implementation. OpenSSL selects its SHA-NI/AVX2 code paths for
+# hashlib.sha256 itself, so SHA-256 needs no dispatch of its own.
+_sha256 = hashlib.sha256
+
+# SHA256 contexts pre-fed with each network's P2PKH version byte
+_VERSION_SHA256 = {
+    network: _sha256(version) for network, version in _P2PKH_VERSION.items()
+}
+
+if _keccak_mod is not None:
+    def _keccak256(data: bytes) -> bytes:
+        """Keccak-256 (the pre-standard SHA3 used by Ethereum)"""
+        return _keccak_mod.new(data=data, digest_bits=256).digest()
+else:
+    def _keccak256(data: bytes) -> bytes:
+        """Keccak-256 (the pre-standard SHA3 used by Ethereum)"""
+        # SHA3-256 pads differently and would give wrong addresses
+        raise ImportError("pycryptodome is required for Ethereum Keccak-256 hashing")
+
+try:
+    # Empty RIPEMD160 context to copy; skips the by-name digest lookup per call
+    _RIPEMD160 = hashlib.new('ripemd160')
+except ValueError:
+    # OpenSSL 3 without the legacy provider
+    _RIPEMD160 = None
+
+if _RIPEMD160 is not None:
+    def _ripemd160(data: bytes) -> bytes:
+        """RIPEMD160 via OpenSSL"""
+        ripemd160 = _RIPEMD160.copy()
+        ripemd160.update(data)
+        return ripemd160.digest()
+elif _RIPEMD160_mod is not None:
+    def _ripemd160(data: bytes) -> bytes:
+        """RIPEMD160 via pycryptodome"""
+        return _RIPEMD160_mod.new(data).digest()
+else:
+    def _ripemd160(data: bytes) -> bytes:
+        """RIPEMD160 via hashlib (raises if OpenSSL lacks it)"""
+        return hashlib.new('ripemd160', data).digest()
+
+
+class AddressRecord(NamedTuple):
+    """
+    A derived address
+
+    Fields can also be read by key (record['address']), as with the dicts
+    the generators returned previously. public_key holds the raw 33-byte
+    compressed key; use public_key_hex when a string is needed.
+
+    The record is a tuple, not a dict: .get(), `key in record` and
+    json.dumps() no longer behave as they did. Use _asdict() (with
+    public_key_hex in place of public_key) when a dict is needed.
+    """
+    path: str
+    public_key: bytes
+    address: str
+    address_type: Optional[str] = None
+
+    @property
+    def public_key_hex(self) -> str:
+        """Compressed public key as a hex string"""
+        return self.public_key.hex()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            # Only the record's fields; tuple methods like count are not keys
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+@lru_cache(maxsize=4096)
+def _derive_cached(public_key: bytes, chain_code: bytes, index: int) -> Tuple[bytes, bytes]:
+    """
+    Memoized non-hardened child derivation
+
+    The child depends only on the parent key, chain code and index, so
+    rescanning an xpub (or deriving its receiving and change branches)
+    reuses earlier results instead of repeating HMAC-SHA512 and EC work.
+    """
+    parent_xpub = ExtendedPublicKey(
+        public_key=public_key,
+        chain_code=chain_code,
+        depth=0,
+        parent_fingerprint=b'\x00\x00\x00\x00',
+        child_number=0
+    )
+    return PublicKeyDerivation.derive_public_child(parent_xpub, index)
+
+
+def _hash160(data: bytes) -> bytes:
+    """RIPEMD160(SHA256(data)), the Bitcoin public key hash"""
+    return _ripemd160(_sha256(data).digest())
+
+
+def _derive_change_xpub(xpub: ExtendedPublicKey, change: int) -> ExtendedPublicKey:
+    """Derive the change-level xpub that all address indices hang off"""
+    change_pubkey, change_chain = _derive_cached(xpub.public_key, xpub.chain_code, change)
+    return ExtendedPublicKey(
+        public_key=change_pubkey,
+        chain_code=change_chain,
+        depth=xpub.depth + 1,
+        parent_fingerprint=b'\x00\x00\x00\x00',
+        child_number=change
+    )
+
+
+def _collect_addresses(
+    worker: Callable[[range], Iterator[AddressRecord]],
+    indices: range
+) -> List[AddressRecord]:
+    """Run an address worker to completion (picklable for the process pool)"""
+    return list(worker(indices))
+
+
+def _generate_address_range(
+    worker: Callable[[range], Iterator[AddressRecord]],
+    start_index: int,
+    count: int,
+    workers: Optional[int] = None
+) -> List[AddressRecord]:
+    """
+    Run an address worker over [start_index, start_index + count)
+
+    Runs in-process unless the caller asks for workers > 1. Each index is
+    derived independently from the change xpub, so the batch can then be
+    split into one contiguous range per worker process. The pool is
+    created per call and needs the caller's script to be import-safe
+    (an `if __name__ == "__main__"` guard) under the spawn start method.
+    """
+    stop = start_index + count
+    if not workers or workers < 2 or count < 2:
+        return list(worker(range(start_index, stop)))
+
+    step = -(-count // workers)
+    ranges = [range(i, min(i + step, stop)) for i in range(start_index, stop, step)]
+
+    addresses = []
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        for chunk in pool.map(partial(_collect_addresses, worker), ranges):
+            addresses.extend(chunk)
+    return addresses
+
+
+def _iter_bitcoin_addresses(
+    change_xpub: ExtendedPublicKey,
+    network: str,
+    address_type: str,
+    indices: range
+) -> Iterator[AddressRecord]:
+    """Derive Bitcoin addresses for a range of indices under a change xpub"""
+    # The path differs only in its last component, so format the rest once
+    path_prefix = f"m/44'/0'/0'/{change_xpub.child_number}/"
+
+    for i in indices:
+        # Derive address key
+        address_pubkey, _ = _derive_cached(change_xpub.public_key, change_xpub.chain_code, i)
+
+        # Generate address with specified type
+        address = BitcoinAddressGenerator.pubkey_to_address(address_pubkey, network, address_type)
+
+        yield AddressRecord(
+            path=path_prefix + str(i),
+            public_key=address_pubkey,
+            address=address,
+            address_type=address_type
+        )
+
+
+def _iter_ethereum_addresses(
+    change_xpub: ExtendedPublicKey,
+    indices: range
+) -> Iterator[AddressRecord]:
+    """Derive Ethereum addresses for a range of indices under a change xpub"""
+    # The path differs only in its last component, so format the rest once
+    path_prefix = f"m/44'/60'/0'/{change_xpub.child_number}/"
+
+    for i in indices:
+        # Derive address key
+        address_pubkey, _ = _derive_cached(change_xpub.public_key, change_xpub.chain_code, i)
+
+        # Generate address
+        address = EthereumAddressGenerator.pubkey_to_address(address_pubkey)
+
+        yield AddressRecord(
+            path=path_prefix + str(i),
+            public_key=address_pubkey,
+            address=address
+        )
+
 
 class BitcoinAddressGenerator:
     """Generate Bitcoin addresses from public keys (no private key needed!)"""
@@ -56,19 +283,21 @@ class BitcoinAddressGenerator:
     def _pubkey_to_p2pkh(public_key: bytes, network: str) -> str:
         """Convert public key to P2PKH address (legacy)"""
         # Hash the public key: SHA256 then RIPEMD160
-        sha256_hash = hashlib.sha256(public_key).digest()
-
-        # RIPEMD160
-        ripemd160 = hashlib.new('ripemd160')
-        ripemd160.update(sha256_hash)
-        pubkey_hash = ripemd160.digest()
+        pubkey_hash = _hash160(public_key)
 
         # Add version byte (0x00 for mainnet, 0x6f for testnet/regtest)
-        version = b'\x6f' if network in ["testnet", "regtest"] else b'\x00'
+        version = _P2PKH_VERSION[network]
         versioned_hash = version + pubkey_hash
 
-        # Calculate checksum (first 4 bytes of double SHA256)
-        checksum = hashlib.sha256(hashlib.sha256(versioned_hash).digest()).digest()[:4]
+        if _b58encode_check is not None:
+            # Checksum and Base58 encoding in a single native call
+            return _b58encode_check(versioned_hash).decode('ascii')
+
+        # Calculate checksum (first 4 bytes of double SHA256), resuming from
+        # a context that has already absorbed the version byte
+        inner = _VERSION_SHA256[network].copy()
+        inner.update(pubkey_hash)
+        checksum = _sha256(inner.digest()).digest()[:4]
 
         # Concatenate and encode to Base58
         address_bytes = versioned_hash + checksum
@@ -80,10 +309,7 @@ class BitcoinAddressGenerator:
         from .bitcoin_transaction import Bech32
 
         # Hash the public key: SHA256 then RIPEMD160
-        sha256_hash = hashlib.sha256(public_key).digest()
-        ripemd160 = hashlib.new('ripemd160')
-        ripemd160.update(sha256_hash)
-        pubkey_hash = ripemd160.digest()
+        pubkey_hash = _hash160(public_key)
 
         # Determine HRP based on network
         if network == "mainnet":
@@ -123,25 +349,24 @@ class BitcoinAddressGenerator:
     @staticmethod
     def _base58_encode(data: bytes) -> str:
         """Encode bytes to Base58"""
-        alphabet = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+        if _b58encode is not None:
+            return _b58encode(data).decode('ascii')
 
         # Convert bytes to integer
         num = int.from_bytes(data, byteorder='big')
 
-        # Convert to base58
-        encoded = ''
+        # Convert to base58, least significant digit first
+        digits = bytearray()
         while num > 0:
             num, remainder = divmod(num, 58)
-            encoded = alphabet[remainder] + encoded
+            digits.append(BASE58_ALPHABET[remainder])
 
         # Add '1' for each leading zero byte
-        for byte in data:
-            if byte == 0:
-                encoded = '1' + encoded
-            else:
-                break
+        leading_zeros = len(data) - len(data.lstrip(b'\x00'))
+        digits.extend(b'1' * leading_zeros)
 
-        return encoded
+        digits.reverse()
+        return digits.decode('ascii')
 
     @staticmethod
     def generate_addresses_from_xpub(
@@ -150,8 +375,9 @@ class BitcoinAddressGenerator:
         start_index: int = 0,
         count: int = 10,
         network: str = "mainnet",
-        address_type: str = "p2pkh"
-    ) -> List[dict]:
+        address_type: str = "p2pkh",
+        workers: Optional[int] = None
+    ) -> List[AddressRecord]:
         """
         Generate multiple Bitcoin addresses from xpub
 
@@ -162,37 +388,41 @@ class BitcoinAddressGenerator:
             count: Number of addresses to generate
             network: Network type - "mainnet", "testnet", or "regtest" (default: "mainnet")
             address_type: Address type - "p2pkh", "p2wpkh", or "p2tr" (default: "p2pkh")
+            workers: Worker processes to split the batch across (default: None,
+                     derive in-process)
 
         Returns:
-            List of dicts with path, public_key, address, and address_type
+            List of AddressRecord with path, public_key, address, and address_type
+            (public_key is bytes; records are tuples, not dicts, so .get(),
+            `in` and json.dumps() do not apply - see AddressRecord)
         """
-        addresses = []
-
-        for i in range(start_index, start_index + count):
-            # Derive change key
-            change_pubkey, change_chain = PublicKeyDerivation.derive_public_child(xpub, change)
-            change_xpub = ExtendedPublicKey(
-                public_key=change_pubkey,
-                chain_code=change_chain,
-                depth=xpub.depth + 1,
-                parent_fingerprint=b'\x00\x00\x00\x00',
-                child_number=change
-            )
+        # Derive change key once; it is the same for every address index
+        change_xpub = _derive_change_xpub(xpub, change)
 
-            # Derive address key
-            address_pubkey, _ = PublicKeyDerivation.derive_public_child(change_xpub, i)
+        # Derive address keys (across processes only if requested)
+        worker = partial(_iter_bitcoin_addresses, change_xpub, network, address_type)
+        return _generate_address_range(worker, start_index, count, workers)
 
-            # Generate address with specified type
-            address = BitcoinAddressGenerator.pubkey_to_address(address_pubkey, network, address_type)
-
-            addresses.append({
-                'path': f"m/44'/0'/0'/{change}/{i}",
-                'public_key': address_pubkey.hex(),
-                'address': address,
-                'address_type': address_type
-            })
+    @staticmethod
+    def iter_addresses_from_xpub(
+        xpub: ExtendedPublicKey,
+        change: int = 0,
+        start_index: int = 0,
+        count: int = 10,
+        network: str = "mainnet",
+        address_type: str = "p2pkh"
+    ) -> Iterator[AddressRecord]:
+        """
+        Lazily generate Bitcoin addresses from xpub
 
-        return addresses
+        Same arguments and records as generate_addresses_from_xpub, but each
+        address is derived as it is consumed, so large scans do not hold
+        every record in memory at once.
+        """
+        change_xpub = _derive_change_xpub(xpub, change)
+        return _iter_bitcoin_addresses(
+            change_xpub, network, address_type, range(start_index, start_index + count)
+        )
 
 
 class EthereumAddressGenerator:
@@ -209,23 +439,19 @@ class EthereumAddressGenerator:
         Returns:
             Ethereum address string (e.g., "0x742d35...")
         """
-        # Decompress public key to get full (x, y) coordinates
-        point = EllipticCurvePoint.from_bytes(public_key)
-
         # Ethereum uses uncompressed public key (without 0x04 prefix)
         # We need the 64 bytes (32 bytes x + 32 bytes y)
-        x_bytes = point.x.to_bytes(32, 'big')
-        y_bytes = point.y.to_bytes(32, 'big')
-        uncompressed = x_bytes + y_bytes
+        if _SecpPublicKey is not None:
+            uncompressed = _SecpPublicKey(public_key).format(compressed=False)[1:]
+        else:
+            # Decompress public key to get full (x, y) coordinates
+            point = EllipticCurvePoint.from_bytes(public_key)
+            x_bytes = point.x.to_bytes(32, 'big')
+            y_bytes = point.y.to_bytes(32, 'big')
+            uncompressed = x_bytes + y_bytes
 
         # Keccak256 hash
-        try:
-            from eth_hash.auto import keccak
-            hash_result = keccak(uncompressed)
-        except ImportError:
-            # Fallback to simple hash for demonstration
-            print("Warning: eth-hash not installed. Using SHA3-256 as fallback.")
-            hash_result = hashlib.sha3_256(uncompressed).digest()
+        hash_result = _keccak256(uncompressed)
 
         # Take last 20 bytes
         address_bytes = hash_result[-20:]
@@ -253,35 +479,31 @@ class EthereumAddressGenerator:
         address_lower = address[2:].lower()
 
         # Hash the lowercase address
-        try:
-            from eth_hash.auto import keccak
-            hash_result = keccak(address_lower.encode('utf-8'))
-        except ImportError:
-            hash_result = hashlib.sha3_256(address_lower.encode('utf-8')).digest()
-
-        hash_hex = hash_result.hex()
-
-        # Apply checksum
-        checksummed = '0x'
-        for i, char in enumerate(address_lower):
-            if char in '0123456789':
-                checksummed += char
-            else:
-                # If hash bit is 1, uppercase; otherwise lowercase
-                if int(hash_hex[i], 16) >= 8:
-                    checksummed += char.upper()
-                else:
-                    checksummed += char
-
-        return checksummed
+        hash_result = _keccak256(address_lower.encode('utf-8'))
+
+        # Apply checksum to all 40 characters at once, treating the ASCII
+        # address and the hex digits of the hash as 320-bit integers with one
+        # character per byte (SWAR)
+        chars = int.from_bytes(address_lower.encode('ascii'), 'big')
+        case_bits = int.from_bytes(
+            hash_result[:20].hex().encode('ascii').translate(_EIP55_CASE_BITS), 'big'
+        )
+
+        # Address letters 'a'-'f' have bit 0x40 set and digits do not, so
+        # shifting it down to 0x20 keeps the case bit only for letters.
+        # If hash bit is 1, uppercase (clear bit 0x20); otherwise leave as is
+        checksummed = chars ^ ((chars >> 1) & case_bits)
+
+        return '0x' + checksummed.to_bytes(40, 'big').decode('ascii')
 
     @staticmethod
     def generate_addresses_from_xpub(
         xpub: ExtendedPublicKey,
         change: int = 0,
         start_index: int = 0,
-        count: int = 10
-    ) -> List[dict]:
+        count: int = 10,
+        workers: Optional[int] = None
+    ) -> List[AddressRecord]:
         """
         Generate multiple Ethereum addresses from xpub
 
@@ -290,36 +512,36 @@ class EthereumAddressGenerator:
             change: 0 for receiving, 1 for change
             start_index: Starting address index
             count: Number of addresses to generate
+            workers: Worker processes to split the batch across (default: None,
+                     derive in-process)
 
         Returns:
-            List of dicts with path, public_key, and address
+            List of AddressRecord with path, public_key, and address
+            (public_key is bytes; records are tuples, not dicts, so .get(),
+            `in` and json.dumps() do not apply - see AddressRecord)
         """
-        addresses = []
+        # Derive change key once; it is the same for every address index
+        change_xpub = _derive_change_xpub(xpub, change)
 
-        for i in range(start_index, start_index + count):
-            # Derive change key
-            change_pubkey, change_chain = PublicKeyDerivation.derive_public_child(xpub, change)
-            change_xpub = ExtendedPublicKey(
-                public_key=change_pubkey,
-                chain_code=change_chain,
-                depth=xpub.depth + 1,
-                parent_fingerprint=b'\x00\x00\x00\x00',
-                child_number=change
-            )
+        # Derive address keys (across processes only if requested)
+        worker = partial(_iter_ethereum_addresses, change_xpub)
+        return _generate_address_range(worker, start_index, count, workers)
 
-            # Derive address key
-            address_pubkey, _ = PublicKeyDerivation.derive_public_child(change_xpub, i)
-
-            # Generate address
-            address = EthereumAddressGenerator.pubkey_to_address(address_pubkey)
-
-            addresses.append({
-                'path': f"m/44'/60'/0'/{change}/{i}",
-                'public_key': address_pubkey.hex(),
-                'address': address
-            })
+    @staticmethod
+    def iter_addresses_from_xpub(
+        xpub: ExtendedPublicKey,
+        change: int = 0,
+        start_index: int = 0,
+        count: int = 10
+    ) -> Iterator[AddressRecord]:
+        """
+        Lazily generate Ethereum addresses from xpub
 
-        return addresses
+        Same arguments and records as generate_addresses_from_xpub, but each
+        address is derived as it is consumed.
+        """
+        change_xpub = _derive_change_xpub(xpub, change)
+        return _iter_ethereum_addresses(change_xpub, range(start_index, start_index + count))
 
 
 if __name__ == "__main__":
@@ -362,7 +584,7 @@ if __name__ == "__main__":
     # Generate unlimited Bitcoin addresses (no MPC needed!)
     print("BITCOIN ADDRESSES (No MPC computation needed!)")
     print("-" * 80)
-    btc_addresses = BitcoinAddressGenerator.generate_addresses_from_xpub(
+    btc_addresses = BitcoinAddressGenerator.iter_addresses_from_xpub(
         btc_xpub, change=0, start_index=0, count=5
     )
 
@@ -374,7 +596,7 @@ if __name__ == "__main__":
     # Generate unlimited Ethereum addresses (no MPC needed!)
     print("ETHEREUM ADDRESSES (No MPC computation needed!)")
     print("-" * 80)
-    eth_addresses = EthereumAddressGenerator.generate_addresses_from_xpub(
+    eth_addresses = EthereumAddressGenerator.iter_addresses_from_xpub(
         eth_xpub, change=0, start_index=0, count=5
     )
 
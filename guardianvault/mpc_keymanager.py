@@ -22,6 +22,13 @@ from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass
 import json
 
+try:
+    # libsecp256k1 bindings: fast fixed-base multiplication by G
+    from coincurve import PrivateKey as _SecpPrivateKey
+except ImportError:
+    # Fall back to the pure-Python double-and-add below
+    _SecpPrivateKey = None
+
 
 # secp256k1 curve parameters
 SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
@@ -64,6 +71,9 @@ class KeyShare:
 @dataclass
 class ExtendedPublicKey:
     """BIP32 Extended Public Key (xpub) - can derive unlimited addresses"""
+    # No per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('public_key', 'chain_code', 'depth', 'parent_fingerprint', 'child_number')
+
     public_key: bytes  # 33 bytes compressed
     chain_code: bytes  # 32 bytes
     depth: int
@@ -135,6 +145,14 @@ class EllipticCurvePoint:
         if scalar == 0 or self.is_infinity:
             return EllipticCurvePoint.infinity()
 
+        # Multiples of G go through libsecp256k1's precomputed tables when available
+        if _SecpPrivateKey is not None and self.x == SECP256K1_GX and self.y == SECP256K1_GY:
+            scalar %= SECP256K1_N
+            if scalar == 0:
+                return EllipticCurvePoint.infinity()
+            x, y = _SecpPrivateKey.from_int(scalar).public_key.point()
+            return EllipticCurvePoint(x, y)
+
         result = EllipticCurvePoint.infinity()
         addend = self
 
@@ -345,15 +363,27 @@ class MPCBIP32:
 
         # Each party computes HMAC locally using their share
         child_shares = []
+        child_chain_code = None
+
+        # All parties key the HMAC with the same chain code, so key it once
+        # and copy the keyed state for each party
+        chain_hmac = hmac.new(parent_chain_code, digestmod=hashlib.sha512)
+        index_bytes = index.to_bytes(4, 'big')
 
         for share in parent_shares:
             # Data = 0x00 || parent_private_key_share || index
-            data = b'\x00' + share.share_value + index.to_bytes(4, 'big')
+            data = b'\x00' + share.share_value + index_bytes
 
             # Compute HMAC
-            hmac_result = hmac.new(parent_chain_code, data, hashlib.sha512).digest()
+            party_hmac = chain_hmac.copy()
+            party_hmac.update(data)
+            hmac_result = party_hmac.digest()
             tweak = int.from_bytes(hmac_result[:32], 'big') % SECP256K1_N
 
+            # Child chain code comes from the first party's derivation
+            if child_chain_code is None:
+                child_chain_code = hmac_result[32:]
+
             # Child share = parent_share + tweak (mod n)
             parent_share_int = int.from_bytes(share.share_value, 'big')
             child_share_int = (parent_share_int + tweak) % SECP256K1_N
@@ -371,12 +401,6 @@ class MPCBIP32:
             )
             child_shares.append(child_share)
 
-        # Compute child chain code (same for all parties)
-        # Using first party's derivation (all should be same)
-        data = b'\x00' + parent_shares[0].share_value + index.to_bytes(4, 'big')
-        hmac_result = hmac.new(parent_chain_code, data, hashlib.sha512).digest()
-        child_chain_code = hmac_result[32:]
-
         # Compute child public key (each party contributes)
         G = EllipticCurvePoint.generator()
         child_public_point = EllipticCurvePoint.infinity()
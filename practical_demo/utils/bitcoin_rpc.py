@@ -1,6 +1,9 @@
 """
 Bitcoin RPC Client for practical demo scripts
 """
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import requests
 
 
@@ -13,20 +16,77 @@ class BitcoinRPCClient:
         # Use wallet-specific endpoint for wallet operations
         self.wallet_url = f"{self.base_url}/wallet/{wallet}"
 
+    @staticmethod
+    def _post(url, payload):
+        """POST a JSON-RPC payload and parse the streamed response body"""
+        # Read the raw body once and hand it straight to orjson, instead of
+        # buffering response.content and decoding it to str for json.loads
+        with requests.post(url, data=orjson.dumps(payload), stream=True,
+                           headers={"Content-Type": "application/json"}) as response:
+            return orjson.loads(response.raw.read(decode_content=True))
+
     def rpc_call(self, method, params=[], use_wallet=False):
         """Make RPC call, optionally using wallet endpoint"""
         url = self.wallet_url if use_wallet else self.base_url
-        response = requests.post(url, json={
+        result = self._post(url, {
             "jsonrpc": "1.0",
             "id": "guardianvault",
             "method": method,
             "params": params
         })
-        result = response.json()
         if 'error' in result and result['error']:
             raise Exception(f"RPC Error: {result['error']}")
         return result['result']
 
+    def rpc_batch(self, calls, use_wallet=False):
+        """
+        Send several RPC calls in a single JSON-RPC batch request
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            List of results in the same order as calls
+        """
+        url = self.wallet_url if use_wallet else self.base_url
+        response = self._post(url, [
+            {"jsonrpc": "1.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ])
+        # A batch rejected as a whole comes back as a single error object
+        if isinstance(response, dict):
+            raise Exception(f"RPC Error: {response.get('error')}")
+        results = [None] * len(calls)
+        for item in response:
+            if item.get('error'):
+                raise Exception(f"RPC Error: {item['error']}")
+            index = item.get('id')
+            if not isinstance(index, int) or not 0 <= index < len(calls):
+                raise Exception(f"RPC Error: unexpected batch response id {index!r}")
+            results[index] = item['result']
+        return results
+
+    def rpc_call_many(self, calls, use_wallet=False, use_batch=True):
+        """
+        Make several independent RPC calls
+
+        Args:
+            calls: List of (method, params) tuples
+            use_batch: Send one JSON-RPC batch request (default), or issue
+                       the calls concurrently from a thread pool
+
+        Returns:
+            List of results in the same order as calls
+        """
+        if not calls:
+            return []
+        if use_batch:
+            return self.rpc_batch(calls, use_wallet=use_wallet)
+        with ThreadPoolExecutor(max_workers=min(len(calls), 8)) as pool:
+            return list(pool.map(
+                lambda call: self.rpc_call(call[0], call[1], use_wallet=use_wallet), calls
+            ))
+
     def getblockchaininfo(self):
         return self.rpc_call("getblockchaininfo")
 
@@ -51,5 +111,10 @@ class BitcoinRPCClient:
     def getrawtransaction(self, txid, verbose=True):
         return self.rpc_call("getrawtransaction", [txid, verbose])
 
+    def getrawtransactions(self, txids, verbose=True, use_batch=True):
+        return self.rpc_call_many(
+            [("getrawtransaction", [txid, verbose]) for txid in txids], use_batch=use_batch
+        )
+
     def getbalance(self):
         return self.rpc_call("getbalance", use_wallet=True)
@@ -0,0 +1,25 @@
+"""
+Display helpers shared by the practical demo verification scripts
+"""
+
+
+def short_hex(value, length: int = 32) -> str:
+    """Leading hex digits of a 256-bit int, bytes or hex string, for display"""
+    if isinstance(value, int):
+        # Shift off the low bits so only the printed digits get formatted
+        return format(value >> (256 - 4 * length), f'0{length}x')
+    if isinstance(value, bytes):
+        return value[:length // 2].hex()
+    return value[:length]
+
+
+class LazyHex:
+    """Defers short_hex until a debug record is actually emitted"""
+    __slots__ = ('value', 'length')
+
+    def __init__(self, value, length: int = 32):
+        self.value = value
+        self.length = length
+
+    def __str__(self):
+        return short_hex(self.value, self.length)
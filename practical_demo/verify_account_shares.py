@@ -6,6 +6,10 @@ Check if the account shares are correct additive shares
 import sys
 import os
 import json
+import hmac
+import logging
+
+from coincurve import PrivateKey
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -13,9 +17,12 @@ from guardianvault.mpc_keymanager import (
     KeyShare,
     MPCBIP32,
     ExtendedPublicKey,
-    EllipticCurvePoint,
+    PublicKeyDerivation,
     SECP256K1_N
 )
+from utils.formatting import LazyHex
+
+logger = logging.getLogger(__name__)
 
 
 def verify_account_shares(vault_config_file: str, share_files: list):
@@ -32,23 +39,25 @@ def verify_account_shares(vault_config_file: str, share_files: list):
     master_chain_code = bytes.fromhex(vault_config['master_chain_code'])
     account_xpub = ExtendedPublicKey.from_dict(vault_config['bitcoin']['xpub'])
 
-    print(f"\nAccount xpub (m/44'/0'/0'):")
-    print(f"  Public key: {account_xpub.public_key.hex()[:32]}...")
-    print(f"  Chain code: {account_xpub.chain_code.hex()[:32]}...")
+    logger.debug("\nAccount xpub (m/44'/0'/0'):")
+    logger.debug("  Public key: %s...", LazyHex(account_xpub.public_key))
+    logger.debug("  Chain code: %s...", LazyHex(account_xpub.chain_code))
 
     # Load guardian account shares
     print(f"\nLoading {len(share_files)} account shares...")
     account_shares_loaded = []
+    account_share_ints = []
     for i, share_file in enumerate(share_files, 1):
         with open(share_file, 'r') as f:
             share_data = json.load(f)
             # Support new account share format
             if 'bitcoin_account_share' in share_data:
                 share = KeyShare.from_dict(share_data['bitcoin_account_share'])
-                print(f"  Guardian {i}: {share.share_value.hex()[:32]}... (account level)")
+                logger.debug("  Guardian %d: %s... (account level)", i, LazyHex(share.share_value))
             else:
                 raise ValueError("Old share format detected. Please regenerate shares!")
             account_shares_loaded.append(share)
+            account_share_ints.append(int.from_bytes(share.share_value, 'big'))
 
     # Verify these account shares are correct
     print(f"\nNote: These are account-level shares (m/44'/0'/0'), not master shares.")
@@ -57,18 +66,18 @@ def verify_account_shares(vault_config_file: str, share_files: list):
     # Test: Verify account shares sum to correct public key
     print(f"\nTest: Verifying account shares sum correctly...")
 
-    G = EllipticCurvePoint.generator()
-    account_sum = sum(int.from_bytes(s.share_value, 'big') for s in account_shares_loaded) % SECP256K1_N
-    account_pub_computed = (G * account_sum).to_bytes(compressed=True)
-
-    print(f"  Guardian 1: {account_shares_loaded[0].share_value.hex()[:32]}...")
-    if len(account_shares_loaded) > 1:
-        print(f"  Guardian 2: {account_shares_loaded[1].share_value.hex()[:32]}...")
-    if len(account_shares_loaded) > 2:
-        print(f"  Guardian 3: {account_shares_loaded[2].share_value.hex()[:32]}...")
-    print(f"  Sum of shares: {hex(account_sum)[:32]}...")
-    print(f"  Computed public key: {account_pub_computed.hex()[:32]}...")
-    print(f"  Expected public key: {account_xpub.public_key.hex()[:32]}...")
+    account_sum = 0
+    for acc_int in account_share_ints:
+        account_sum += acc_int
+    account_sum %= SECP256K1_N
+    account_pub_computed = PrivateKey.from_int(account_sum).public_key.format(compressed=True)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, share in enumerate(account_shares_loaded[:3], 1):
+            logger.debug("  Guardian %d: %s...", i, LazyHex(share.share_value))
+    logger.debug("  Sum of shares: %s...", LazyHex(account_sum))
+    logger.debug("  Computed public key: %s...", LazyHex(account_pub_computed))
+    logger.debug("  Expected public key: %s...", LazyHex(account_xpub.public_key))
     print(f"  Match: {account_pub_computed == account_xpub.public_key}")
 
     if account_pub_computed != account_xpub.public_key:
@@ -83,44 +92,41 @@ def verify_account_shares(vault_config_file: str, share_files: list):
     print(f"\nTest 2: Testing non-hardened derivation (m/44'/0'/0'/0)...")
 
     # Use the PUBLIC derivation
-    from guardianvault.mpc_keymanager import PublicKeyDerivation
-
     change_pub, change_chain = PublicKeyDerivation.derive_public_child(
         account_xpub, 0
     )
 
-    print(f"  Expected change public key: {change_pub.hex()[:32]}...")
+    logger.debug("  Expected change public key: %s...", LazyHex(change_pub))
 
     # Now derive change shares with our formula
-    import hmac
-    import hashlib
-
     data = account_xpub.public_key + (0).to_bytes(4, 'big')
-    hmac_result = hmac.new(account_xpub.chain_code, data, hashlib.sha512).digest()
+    hmac_result = hmac.new(account_xpub.chain_code, data, 'sha512').digest()
     tweak = int.from_bytes(hmac_result[:32], 'big') % SECP256K1_N
 
-    print(f"  Tweak: {hex(tweak)[:32]}...")
+    logger.debug("  Tweak: %s...", LazyHex(tweak))
 
     # Each guardian adds tweak/n
     n = len(account_shares_loaded)
     tweak_share = (tweak * pow(n, -1, SECP256K1_N)) % SECP256K1_N
 
-    print(f"  Tweak per guardian (tweak/{n}): {hex(tweak_share)[:32]}...")
+    logger.debug("  Tweak per guardian (tweak/%d): %s...", n, LazyHex(tweak_share))
 
     change_shares = []
-    for i, acc_share in enumerate(account_shares_loaded, 1):
-        acc_int = int.from_bytes(acc_share.share_value, 'big')
+    for i, acc_int in enumerate(account_share_ints, 1):
         change_int = (acc_int + tweak_share) % SECP256K1_N
         change_shares.append(change_int)
-        print(f"  Guardian {i} change share: {hex(change_int)[:32]}...")
+        logger.debug("  Guardian %d change share: %s...", i, LazyHex(change_int))
 
     # Sum and verify
-    change_sum = sum(change_shares) % SECP256K1_N
-    change_pub_computed = (G * change_sum).to_bytes(compressed=True)
-
-    print(f"\n  Sum of change shares: {hex(change_sum)[:32]}...")
-    print(f"  Computed change public key: {change_pub_computed.hex()[:32]}...")
-    print(f"  Expected change public key: {change_pub.hex()[:32]}...")
+    change_sum = 0
+    for change_int in change_shares:
+        change_sum += change_int
+    change_sum %= SECP256K1_N
+    change_pub_computed = PrivateKey.from_int(change_sum).public_key.format(compressed=True)
+
+    logger.debug("\n  Sum of change shares: %s...", LazyHex(change_sum))
+    logger.debug("  Computed change public key: %s...", LazyHex(change_pub_computed))
+    logger.debug("  Expected change public key: %s...", LazyHex(change_pub))
     print(f"  Match: {change_pub_computed == change_pub}")
 
     if change_pub_computed != change_pub:
@@ -138,8 +144,12 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Verify account shares")
     parser.add_argument('--vault-config', '-c', required=True)
     parser.add_argument('--shares', nargs='+', required=True)
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Show intermediate share, key and nonce values')
 
     args = parser.parse_args()
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
 
     try:
         success = verify_account_shares(args.vault_config, args.shares)
@@ -7,6 +7,11 @@ import sys
 import os
 import json
 import argparse
+import hmac
+import logging
+from functools import lru_cache
+
+from coincurve import PrivateKey
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -15,9 +20,29 @@ from guardianvault.mpc_keymanager import (
     MPCBIP32,
     ExtendedPublicKey,
     PublicKeyDerivation,
-    EllipticCurvePoint,
     SECP256K1_N
 )
+from utils.formatting import LazyHex
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def _chain_hmac(chain_code: bytes):
+    """HMAC-SHA512 keyed with a chain code, copied for each child index"""
+    return hmac.new(chain_code, digestmod='sha512')
+
+
+@lru_cache(maxsize=4096)
+def _tweak(chain_code: bytes, pubkey: bytes, index: int) -> int:
+    """Non-hardened BIP32 tweak for (chain_code, pubkey, index)
+
+    Every guardian derives with the same tweak, so it is computed once
+    per level rather than once per guardian.
+    """
+    h = _chain_hmac(chain_code).copy()
+    h.update(pubkey + index.to_bytes(4, 'big'))
+    return int.from_bytes(h.digest()[:32], 'big') % SECP256K1_N
 
 
 def verify_key_derivation(vault_config_file: str, share_files: list, address_index: int = 0):
@@ -35,12 +60,13 @@ def verify_key_derivation(vault_config_file: str, share_files: list, address_ind
     xpub = ExtendedPublicKey.from_dict(vault_config['bitcoin']['xpub'])
 
     print(f"\nVault: {vault_config.get('name', 'Unknown')}")
-    print(f"Master chain code: {master_chain_code.hex()[:32]}...")
-    print(f"Account xpub: {xpub.public_key.hex()[:32]}...")
+    logger.debug("Master chain code: %s...", LazyHex(master_chain_code))
+    logger.debug("Account xpub: %s...", LazyHex(xpub.public_key))
 
     # Load guardian account shares
     print(f"\nLoading {len(share_files)} guardian account shares...")
     account_shares_list = []
+    account_share_ints = []
     for i, share_file in enumerate(share_files, 1):
         with open(share_file, 'r') as f:
             share_data = json.load(f)
@@ -51,88 +77,70 @@ def verify_key_derivation(vault_config_file: str, share_files: list, address_ind
             else:
                 raise ValueError("Old share format detected. Please regenerate shares!")
             account_shares_list.append(share)
+            account_share_ints.append(int.from_bytes(share.share_value, 'big'))
 
     # Shares are already at account level (m/44'/0'/0')
     print(f"\nNote: Shares are already at account level (m/44'/0'/0')")
     print(f"      No hardened derivation needed, proceeding to non-hardened derivation...")
 
-    # Store account shares with chain code
-    account_shares = [(s, xpub.chain_code) for s in account_shares_list]
-
-    for i, (acc_share, _) in enumerate(account_shares, 1):
-        print(f"  Guardian {i}: {acc_share.share_value.hex()[:32]}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, acc_share in enumerate(account_shares_list, 1):
+            logger.debug("  Guardian %d: %s...", i, LazyHex(acc_share.share_value))
 
     # Derive address-level shares (m/44'/0'/0'/0/address_index)
     print(f"\nDeriving address shares (m/44'/0'/0'/0/{address_index})...")
 
-    def derive_non_hardened_child_share(parent_share, parent_pubkey, parent_chain, index, total_parties):
-        """Derive non-hardened child with correct additive secret sharing"""
-        import hmac
-        import hashlib
-
+    def derive_non_hardened_child_shares(parent_ints, parent_pubkey, parent_chain, index, inv_n):
+        """Derive every guardian's non-hardened child share (as ints) with correct additive secret sharing"""
         if index >= 0x80000000:
             raise ValueError("Must be non-hardened")
 
-        data = parent_pubkey + index.to_bytes(4, 'big')
-        hmac_result = hmac.new(parent_chain, data, hashlib.sha512).digest()
-        tweak = int.from_bytes(hmac_result[:32], 'big') % SECP256K1_N
+        tweak = _tweak(parent_chain, parent_pubkey, index)
 
         # For additive secret sharing: each party adds tweak/n
-        tweak_share = (tweak * pow(total_parties, -1, SECP256K1_N)) % SECP256K1_N
-
-        parent_int = int.from_bytes(parent_share.share_value, 'big')
-        child_int = (parent_int + tweak_share) % SECP256K1_N
+        tweak_share = (tweak * inv_n) % SECP256K1_N
 
-        return KeyShare(
-            party_id=parent_share.party_id,
-            share_value=child_int.to_bytes(32, 'big'),
-            total_parties=parent_share.total_parties,
-            threshold=parent_share.threshold,
-            metadata={'derived': True}
-        )
+        return [(parent_int + tweak_share) % SECP256K1_N for parent_int in parent_ints]
 
     # Derive change level (0) for all guardians
     change_pubkey, change_chain = PublicKeyDerivation.derive_public_child(xpub, 0)
     change_xpub = ExtendedPublicKey(change_pubkey, change_chain, xpub.depth + 1, b'\x00'*4, 0)
 
     total_parties = len(account_shares_list)
-    change_shares = []
-    for i, (acc_share, acc_chain) in enumerate(account_shares, 1):
-        change_share = derive_non_hardened_child_share(
-            acc_share, xpub.public_key, xpub.chain_code, 0, total_parties
-        )
-        change_shares.append(change_share)
-        print(f"  Guardian {i} change share: {change_share.share_value.hex()[:32]}...")
+    inv_n = pow(total_parties, -1, SECP256K1_N)
+    change_shares = derive_non_hardened_child_shares(
+        account_share_ints, xpub.public_key, xpub.chain_code, 0, inv_n
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, change_int in enumerate(change_shares, 1):
+            logger.debug("  Guardian %d change share: %s...", i, LazyHex(change_int))
 
     # Derive address level (address_index) for all guardians
     address_pubkey, _ = PublicKeyDerivation.derive_public_child(change_xpub, address_index)
 
-    address_shares = []
-    for i, change_share in enumerate(change_shares, 1):
-        address_share = derive_non_hardened_child_share(
-            change_share, change_pubkey, change_chain, address_index, total_parties
-        )
-        address_shares.append(address_share)
-        print(f"  Guardian {i} address share: {address_share.share_value.hex()[:32]}...")
+    address_shares = derive_non_hardened_child_shares(
+        change_shares, change_pubkey, change_chain, address_index, inv_n
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, address_int in enumerate(address_shares, 1):
+            logger.debug("  Guardian %d address share: %s...", i, LazyHex(address_int))
 
     # Verify: Sum of shares should give us the correct public key
     print(f"\nVerifying derived public key...")
 
     # Sum all address-level shares
     total_key = 0
-    for address_share in address_shares:
-        share_int = int.from_bytes(address_share.share_value, 'big')
-        total_key = (total_key + share_int) % SECP256K1_N
+    for address_int in address_shares:
+        total_key += address_int
+    total_key %= SECP256K1_N
 
-    print(f"  Sum of shares (x): {hex(total_key)[:32]}...")
+    logger.debug("  Sum of shares (x): %s...", LazyHex(total_key))
 
     # Compute public key from sum
-    G = EllipticCurvePoint.generator()
-    computed_pubkey_point = G * total_key
-    computed_pubkey = computed_pubkey_point.to_bytes(compressed=True)
+    computed_pubkey = PrivateKey.from_int(total_key).public_key.format(compressed=True)
 
-    print(f"  Computed pubkey: {computed_pubkey.hex()[:32]}...")
-    print(f"  Expected pubkey: {address_pubkey.hex()[:32]}...")
+    logger.debug("  Computed pubkey: %s...", LazyHex(computed_pubkey))
+    logger.debug("  Expected pubkey: %s...", LazyHex(address_pubkey))
 
     if computed_pubkey == address_pubkey:
         print(f"\n✅ KEY DERIVATION IS CORRECT!")
@@ -151,8 +159,12 @@ def main():
     parser.add_argument('--vault-config', '-c', required=True, help='Vault config file')
     parser.add_argument('--shares', nargs='+', required=True, help='Guardian share files')
     parser.add_argument('--address-index', '-a', type=int, default=0, help='Address index')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Show intermediate share, key and nonce values')
 
     args = parser.parse_args()
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
 
     try:
         success = verify_key_derivation(
@@ -7,44 +7,73 @@ import sys
 import os
 import json
 import argparse
-import requests
+import asyncio
+import logging
+import aiohttp
+from coincurve import PrivateKey, PublicKey
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from guardianvault.mpc_keymanager import ExtendedPublicKey, PublicKeyDerivation, SECP256K1_N, EllipticCurvePoint
-from guardianvault.mpc_signing import MPCSigner, ThresholdSignature
+from guardianvault.mpc_keymanager import ExtendedPublicKey, PublicKeyDerivation, SECP256K1_N
+from guardianvault.mpc_signing import ThresholdSignature
+from utils.formatting import LazyHex, short_hex
 
+logger = logging.getLogger(__name__)
 
-def verify_mpc_computation(transaction_id: str, server_url: str, vault_config_file: str, share_files: list):
+
+async def fetch_transaction(session: aiohttp.ClientSession, server_url: str, transaction_id: str):
+    """Fetch a transaction from the coordination server, or None on failure"""
+    async with session.get(f"{server_url}/api/transactions/{transaction_id}") as response:
+        if response.status != 200:
+            return None
+        return await response.json()
+
+
+def load_vault_and_shares(vault_config_file: str, share_files: list):
+    """Load the vault config and guardian share files from disk"""
+    with open(vault_config_file, 'r') as f:
+        vault_config = json.load(f)
+
+    shares = []
+    for share_file in share_files:
+        with open(share_file, 'r') as f:
+            share_data = json.load(f)
+            shares.append(share_data)
+
+    return vault_config, shares
+
+
+async def verify_mpc_computation(transaction_id: str, server_url: str, vault_config_file: str, share_files: list):
     """Verify the MPC signature computation step by step"""
 
     print("="*70)
     print("MPC SIGNATURE VERIFICATION")
     print("="*70)
 
+    # Fetch the transaction while the local files are read in a worker thread
+    loop = asyncio.get_running_loop()
+    async with aiohttp.ClientSession() as session:
+        tx, (vault_config, shares) = await asyncio.gather(
+            fetch_transaction(session, server_url, transaction_id),
+            loop.run_in_executor(None, load_vault_and_shares, vault_config_file, share_files)
+        )
+
     # Step 1: Fetch transaction
     print("\nStep 1: Fetching transaction...")
-    response = requests.get(f"{server_url}/api/transactions/{transaction_id}")
-    if response.status_code != 200:
+    if tx is None:
         print(f"❌ Failed to fetch transaction")
         return False
 
-    tx = response.json()
     print(f"✓ Transaction fetched: {transaction_id}")
     print(f"  Status: {tx['status']}")
-    print(f"  Message Hash: {tx['message_hash'][:32]}...")
+    logger.debug("  Message Hash: %s...", LazyHex(tx['message_hash']))
+
+    # Parse the message hash once; z is reused by every later check
+    message_hash = bytes.fromhex(tx['message_hash'])
+    z = int.from_bytes(message_hash, 'big')
 
     # Step 2: Load vault config and shares
     print("\nStep 2: Loading vault config and shares...")
-    with open(vault_config_file, 'r') as f:
-        vault_config = json.load(f)
-
-    shares = []
-    for share_file in share_files:
-        with open(share_file, 'r') as f:
-            share_data = json.load(f)
-            shares.append(share_data)
-
     print(f"✓ Loaded {len(shares)} guardian shares")
 
     # Step 3: Get Round 1 data from transaction
@@ -59,43 +88,41 @@ def verify_mpc_computation(transaction_id: str, server_url: str, vault_config_fi
         nonce_hex = data['nonce_share']
         r_points.append(bytes.fromhex(r_point_hex))
         nonce_shares.append(int.from_bytes(bytes.fromhex(nonce_hex), 'big'))
-        print(f"  {guardian_id}:")
-        print(f"    R point: {r_point_hex[:32]}...")
-        print(f"    Nonce: {nonce_hex[:32]}...")
+        logger.debug("  %s:", guardian_id)
+        logger.debug("    R point: %s...", LazyHex(r_point_hex))
+        logger.debug("    Nonce: %s...", LazyHex(nonce_hex))
 
     # Step 4: Verify Round 2 computation
     print("\nStep 4: Verifying Round 2 computation...")
     round2_data = tx.get('round2_data', {})
 
-    # Combine R points
-    combined_r = EllipticCurvePoint.infinity()
-    for r_bytes in r_points:
-        r_point = EllipticCurvePoint.from_bytes(r_bytes)
-        combined_r = combined_r + r_point
+    # Combine R points in a single libsecp256k1 call
+    combined_r_bytes = PublicKey.combine_keys([PublicKey(r) for r in r_points]).format(compressed=False)
+    combined_r_x = int.from_bytes(combined_r_bytes[1:33], 'big')
+    combined_r_y = int.from_bytes(combined_r_bytes[33:65], 'big')
 
-    computed_r = combined_r.x % SECP256K1_N
+    computed_r = combined_r_x % SECP256K1_N
     stored_r = int(round2_data['r'])
 
-    print(f"  Computed r: {hex(computed_r)[:32]}...")
-    print(f"  Stored r:   {hex(stored_r)[:32]}...")
-    print(f"  Match: {computed_r == stored_r}")
+    logger.debug("  Computed r: %s...", LazyHex(computed_r))
+    logger.debug("  Stored r:   %s...", LazyHex(stored_r))
+    print(f"  r match: {computed_r == stored_r}")
 
     # Compute k_total
     k_total_computed = sum(nonce_shares) % SECP256K1_N
     k_total_stored = int(round2_data['kTotal'])
 
-    print(f"  Computed k_total: {hex(k_total_computed)[:32]}...")
-    print(f"  Stored k_total:   {hex(k_total_stored)[:32]}...")
-    print(f"  Match: {k_total_computed == k_total_stored}")
+    logger.debug("  Computed k_total: %s...", LazyHex(k_total_computed))
+    logger.debug("  Stored k_total:   %s...", LazyHex(k_total_stored))
+    print(f"  k_total match: {k_total_computed == k_total_stored}")
 
     # Verify R = k_total * G
-    G = EllipticCurvePoint.generator()
-    R_from_k = G * k_total_computed
-    print(f"  R from k_total: ({hex(R_from_k.x)[:20]}..., {hex(R_from_k.y)[:20]}...)")
-    print(f"  Combined R:     ({hex(combined_r.x)[:20]}..., {hex(combined_r.y)[:20]}...)")
-    print(f"  Match: {R_from_k.x == combined_r.x and R_from_k.y == combined_r.y}")
+    R_from_k_x, R_from_k_y = PrivateKey.from_int(k_total_computed).public_key.point()
+    logger.debug("  R from k_total: (%s..., %s...)", LazyHex(R_from_k_x, 20), LazyHex(R_from_k_y, 20))
+    logger.debug("  Combined R:     (%s..., %s...)", LazyHex(combined_r_x, 20), LazyHex(combined_r_y, 20))
+    print(f"  R = k_total*G match: {R_from_k_x == combined_r_x and R_from_k_y == combined_r_y}")
 
-    if R_from_k.x != combined_r.x or R_from_k.y != combined_r.y:
+    if R_from_k_x != combined_r_x or R_from_k_y != combined_r_y:
         print("  ❌ ERROR: R point mismatch!")
         return False
 
@@ -108,34 +135,32 @@ def verify_mpc_computation(transaction_id: str, server_url: str, vault_config_fi
     print(f"  Address index: {address_index}")
 
     # Derive the same shares the guardians would have used
-    master_chain_code = bytes.fromhex(vault_config['master_chain_code'])
     xpub = ExtendedPublicKey.from_dict(vault_config['bitcoin']['xpub'])
 
-    message_hash = bytes.fromhex(tx['message_hash'])
     r = stored_r
     k_total = k_total_stored
-    z = int.from_bytes(message_hash, 'big')
 
-    print(f"\n  Signature parameters:")
-    print(f"    z (message): {hex(z)[:32]}...")
-    print(f"    r: {hex(r)[:32]}...")
-    print(f"    k_total: {hex(k_total)[:32]}...")
+    logger.debug("\n  Signature parameters:")
+    logger.debug("    z (message): %s...", LazyHex(z))
+    logger.debug("    r: %s...", LazyHex(r))
+    logger.debug("    k_total: %s...", LazyHex(k_total))
 
     # Check each guardian's signature share
     total_s = 0
     for guardian_id, data in round3_data.items():
         s_i_stored = int(data['signature_share'])
-        total_s = (total_s + s_i_stored) % SECP256K1_N
-        print(f"\n  {guardian_id}:")
-        print(f"    s_i: {hex(s_i_stored)[:32]}...")
+        total_s += s_i_stored
+        logger.debug("\n  %s:", guardian_id)
+        logger.debug("    s_i: %s...", LazyHex(s_i_stored))
+    total_s %= SECP256K1_N
 
-    print(f"\n  Combined s: {hex(total_s)[:32]}...")
+    logger.debug("\n  Combined s: %s...", LazyHex(total_s))
 
     # Apply low-S enforcement
     if total_s > SECP256K1_N // 2:
         print(f"  Applying low-S enforcement...")
         total_s = SECP256K1_N - total_s
-        print(f"  New s: {hex(total_s)[:32]}...")
+        logger.debug("  New s: %s...", LazyHex(total_s))
 
     # Step 6: Verify the final signature
     print("\nStep 6: Verifying final signature...")
@@ -143,8 +168,8 @@ def verify_mpc_computation(transaction_id: str, server_url: str, vault_config_fi
     final_r = int(final_sig['r'])
     final_s = int(final_sig['s'])
 
-    print(f"  Stored r: {hex(final_r)[:32]}...")
-    print(f"  Stored s: {hex(final_s)[:32]}...")
+    logger.debug("  Stored r: %s...", LazyHex(final_r))
+    logger.debug("  Stored s: %s...", LazyHex(final_s))
     print(f"  r matches: {r == final_r}")
     print(f"  s matches: {total_s == final_s}")
 
@@ -155,10 +180,10 @@ def verify_mpc_computation(transaction_id: str, server_url: str, vault_config_fi
     pubkeys = PublicKeyDerivation.derive_address_public_keys(xpub, change=0, num_addresses=address_index + 1)
     correct_pubkey = pubkeys[address_index]
 
-    print(f"  Public key: {correct_pubkey.hex()[:32]}...")
+    logger.debug("  Public key: %s...", LazyHex(correct_pubkey))
 
     signature = ThresholdSignature(r=r, s=total_s)
-    valid = MPCSigner.verify_signature(correct_pubkey, message_hash, signature)
+    valid = PublicKey(correct_pubkey).verify(signature.to_der(), message_hash, hasher=None)
 
     print(f"  ✓ Signature valid: {valid}")
 
@@ -167,33 +192,31 @@ def verify_mpc_computation(transaction_id: str, server_url: str, vault_config_fi
         print("\nDebug: Let me manually verify the ECDSA equation...")
 
         # Manual verification
-        pubkey_point = EllipticCurvePoint.from_bytes(correct_pubkey)
-
         # Compute w = s^(-1) mod n
         w = pow(total_s, -1, SECP256K1_N)
-        print(f"  w = s^(-1): {hex(w)[:32]}...")
+        print(f"  w = s^(-1): {short_hex(w)}...")
 
         # Compute u1 = z * w mod n
         u1 = (z * w) % SECP256K1_N
-        print(f"  u1 = z*w: {hex(u1)[:32]}...")
+        print(f"  u1 = z*w: {short_hex(u1)}...")
 
         # Compute u2 = r * w mod n
         u2 = (r * w) % SECP256K1_N
-        print(f"  u2 = r*w: {hex(u2)[:32]}...")
+        print(f"  u2 = r*w: {short_hex(u2)}...")
 
         # Compute P = u1*G + u2*PubKey
-        P1 = G * u1
-        P2 = pubkey_point * u2
-        P = P1 + P2
+        P1 = PrivateKey.from_int(u1).public_key
+        P2 = PublicKey(correct_pubkey).multiply(u2.to_bytes(32, 'big'))
+        P_x, P_y = PublicKey.combine_keys([P1, P2]).point()
 
         print(f"  P = u1*G + u2*Q:")
-        print(f"    x: {hex(P.x)[:32]}...")
-        print(f"    y: {hex(P.y)[:32]}...")
+        print(f"    x: {short_hex(P_x)}...")
+        print(f"    y: {short_hex(P_y)}...")
 
         # Check if r == P.x mod n
-        computed_r = P.x % SECP256K1_N
-        print(f"  P.x mod n: {hex(computed_r)[:32]}...")
-        print(f"  r:         {hex(r)[:32]}...")
+        computed_r = P_x % SECP256K1_N
+        print(f"  P.x mod n: {short_hex(computed_r)}...")
+        print(f"  r:         {short_hex(r)}...")
         print(f"  Match: {computed_r == r}")
 
         # Additional debug: check if the signature equation holds
@@ -216,16 +239,20 @@ def main():
     parser.add_argument('--server', '-s', default='http://localhost:8000', help='Server URL')
     parser.add_argument('--vault-config', '-c', required=True, help='Vault config file')
     parser.add_argument('--shares', nargs='+', required=True, help='Guardian share files')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Show intermediate share, key and nonce values')
 
     args = parser.parse_args()
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
 
     try:
-        success = verify_mpc_computation(
+        success = asyncio.run(verify_mpc_computation(
             transaction_id=args.transaction_id,
             server_url=args.server,
             vault_config_file=args.vault_config,
             share_files=args.shares
-        )
+        ))
 
         sys.exit(0 if success else 1)
     except Exception as e:
@@ -4,7 +4,21 @@ Debug script to check transaction status in MongoDB
 """
 import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
-import json
+import orjson
+
+# Only the fields printed below are fetched from MongoDB
+TRANSACTION_PROJECTION = {
+    '_id': 0,
+    'transaction_id': 1,
+    'status': 1,
+    'error_message': 1,
+    'signatures_required': 1,
+    'signatures_received': 1,
+    'round1_data': 1,
+    'round2_data': 1,
+    'round3_data': 1,
+    'final_signature': 1,
+}
 
 async def check_transaction():
     # Connect to MongoDB
@@ -12,7 +26,9 @@ async def check_transaction():
     db = client.guardianvault
 
     # Get the most recent transaction
-    transactions = await db.transactions.find().sort("created_at", -1).limit(1).to_list(1)
+    transactions = await db.transactions.find(
+        {}, projection=TRANSACTION_PROJECTION
+    ).sort("created_at", -1).limit(1).to_list(1)
 
     if not transactions:
         print("No transactions found in database")
@@ -60,10 +76,8 @@ async def check_transaction():
     else:
         print("No final signature")
 
-    print(f"\n--- Full Transaction Document ---")
-    # Remove the _id field for cleaner output
-    tx.pop('_id', None)
-    print(json.dumps(tx, indent=2, default=str))
+    print(f"\n--- Transaction Document (selected fields) ---")
+    print(orjson.dumps(tx, option=orjson.OPT_INDENT_2, default=str).decode())
 
     client.close()
 
@@ -16,14 +16,17 @@ Prerequisites:
 """
 
 import asyncio
-import json
+import os
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List
 import socketio
 from ecdsa.curves import SECP256k1
 from ecdsa.ellipticcurve import Point
 import hashlib
-import secrets
 
 # Import existing MPC crypto modules from guardianvault package
 from guardianvault.mpc_keymanager import (
@@ -35,9 +38,24 @@ from guardianvault.mpc_keymanager import (
 from guardianvault.mpc_signing import MPCSigner, KeyShare
 from guardianvault.mpc_addresses import BitcoinAddressGenerator, EthereumAddressGenerator
 
+try:
+    # guardianvault uses libsecp256k1 through coincurve when it is installed
+    import coincurve  # noqa: F401
+    HAS_COINCURVE = True
+except ImportError:
+    HAS_COINCURVE = False
+
 # Configuration
 COORD_SERVER_URL = "http://localhost:8000"
 COORD_WS_URL = "ws://localhost:8000"
+GUARDIAN_NAMES = ["Alice", "Bob", "Charlie", "Diana", "Eve"]
+# Set GV_DEBUG=1 to log every Socket.IO event the guardians receive
+DEBUG_EVENTS = bool(os.environ.get("GV_DEBUG"))
+
+# One keep-alive session for all synchronous REST calls in the workflow
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
 
 class Colors:
     HEADER = '\033[95m'
@@ -68,11 +86,40 @@ def print_error(message: str):
     print(f"{Colors.FAIL}✗ {message}{Colors.ENDC}")
 
 
+# Test-workflow seeds are sliced from one os.urandom() pool so repeated vault
+# generation costs one getrandom() call per 1024 seeds.
+# Test use only: production key material must not come from a shared pool.
+_SEED_POOL_SIZE = 32 * 1024
+_seed_pool = b""
+_seed_offset = 0
+
+
+def _next_seed() -> bytes:
+    """Return the next unused 32-byte seed from the entropy pool"""
+    global _seed_pool, _seed_offset
+    if _seed_offset + 32 > len(_seed_pool):
+        _seed_pool = os.urandom(_SEED_POOL_SIZE)
+        _seed_offset = 0
+    seed = _seed_pool[_seed_offset:_seed_offset + 32]
+    _seed_offset += 32
+    return seed
+
+
 # ==============================================================================
 # STEP 1: Generate Key Shares (Offline)
 # ==============================================================================
 
-def generate_key_shares(num_parties: int = 3, threshold: int = 3):
+def derive_coin_account(shares_44, pub_44, chain_44, coin_type: int, account: int = 0):
+    """Derive m/44'/coin_type'/account' shares from the m/44' level"""
+    coin_shares, coin_pub, coin_chain = MPCBIP32.derive_hardened_child_distributed(
+        shares_44, pub_44, chain_44, coin_type
+    )
+    return MPCBIP32.derive_hardened_child_distributed(
+        coin_shares, coin_pub, coin_chain, account
+    )
+
+
+async def generate_key_shares(num_parties: int = 3, threshold: int = 3):
     """Generate MPC key shares for guardians"""
     print_step("1", "Generating MPC Key Shares")
 
@@ -83,83 +130,66 @@ def generate_key_shares(num_parties: int = 3, threshold: int = 3):
 
     # Derive BIP32 master keys
     print_info("Deriving BIP32 master keys...")
-    seed = secrets.token_bytes(32)
-    master_shares, master_pubkey, master_chain = MPCBIP32.derive_master_keys_threshold(shares, seed)
+    seed = _next_seed()
+    master_shares, master_pubkey, master_chain = MPCBIP32.derive_master_keys_distributed(shares, seed)
     print_success(f"Master public key: {master_pubkey.hex()[:32]}...")
 
-    # Derive Bitcoin account xpub (m/44'/0'/0')
-    print_info("Deriving Bitcoin account (m/44'/0'/0')...")
-    btc_xpub = MPCBIP32.derive_account_xpub_threshold(
-        master_shares, master_chain, coin_type=0, account=0
-    )
-
-    # Get the Bitcoin account shares
-    # Derive m/44' -> m/44'/0' -> m/44'/0'/0'
-    btc_shares_44, btc_pub_44, btc_chain_44 = MPCBIP32.derive_hardened_child_threshold(
+    # Derive the shared purpose level (m/44') once for both coins
+    shares_44, pub_44, chain_44 = MPCBIP32.derive_hardened_child_distributed(
         master_shares, master_pubkey, master_chain, 44
     )
-    btc_shares_0, btc_pub_0, btc_chain_0 = MPCBIP32.derive_hardened_child_threshold(
-        btc_shares_44, btc_pub_44, btc_chain_44, 0
-    )
-    btc_master_shares, btc_pub_final, btc_chain_final = MPCBIP32.derive_hardened_child_threshold(
-        btc_shares_0, btc_pub_0, btc_chain_0, 0
-    )
-
-    # Derive Ethereum account xpub (m/44'/60'/0')
-    print_info("Deriving Ethereum account (m/44'/60'/0')...")
-    eth_xpub = MPCBIP32.derive_account_xpub_threshold(
-        master_shares, master_chain, coin_type=60, account=0
-    )
 
-    # Get the Ethereum account shares
-    # Derive m/44' -> m/44'/60' -> m/44'/60'/0'
-    eth_shares_44, eth_pub_44, eth_chain_44 = MPCBIP32.derive_hardened_child_threshold(
-        master_shares, master_pubkey, master_chain, 44
-    )
-    eth_shares_60, eth_pub_60, eth_chain_60 = MPCBIP32.derive_hardened_child_threshold(
-        eth_shares_44, eth_pub_44, eth_chain_44, 60
-    )
-    eth_master_shares, eth_pub_final, eth_chain_final = MPCBIP32.derive_hardened_child_threshold(
-        eth_shares_60, eth_pub_60, eth_chain_60, 0
-    )
+    # Get the account shares. The Bitcoin (m/44'/0'/0') and Ethereum
+    # (m/44'/60'/0') chains are independent CPU-bound work. With coincurve
+    # each takes well under a millisecond, less than starting a process
+    # pool, so only the pure-Python point arithmetic runs them in parallel
+    print_info("Deriving Bitcoin (m/44'/0'/0') and Ethereum (m/44'/60'/0') accounts...")
+    if not HAS_COINCURVE:
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            (btc_master_shares, btc_pub_final, btc_chain_final), \
+                (eth_master_shares, eth_pub_final, eth_chain_final) = await asyncio.gather(
+                    loop.run_in_executor(pool, derive_coin_account, shares_44, pub_44, chain_44, 0),
+                    loop.run_in_executor(pool, derive_coin_account, shares_44, pub_44, chain_44, 60)
+                )
+    else:
+        btc_master_shares, btc_pub_final, btc_chain_final = derive_coin_account(
+            shares_44, pub_44, chain_44, 0
+        )
+        eth_master_shares, eth_pub_final, eth_chain_final = derive_coin_account(
+            shares_44, pub_44, chain_44, 60
+        )
 
     # Save shares to files
     parties_data = []
-    for i in range(num_parties):
+    party_files = []
+    for i, (share, btc_share, eth_share) in enumerate(
+        zip(shares, btc_master_shares, eth_master_shares)
+    ):
         party_data = {
             "party_id": i + 1,
-            "name": ["Alice", "Bob", "Charlie", "Diana", "Eve"][i],
-            "key_share": {
-                "party_id": shares[i].party_id,
-                "share_value": shares[i].share_value.hex(),
-                "total_parties": shares[i].total_parties,
-                "threshold": shares[i].threshold,
-                "metadata": shares[i].metadata
-            },
+            "name": GUARDIAN_NAMES[i],
+            "key_share": share.to_dict(),
             "master_shares": {
-                "bitcoin": {
-                    "party_id": btc_master_shares[i].party_id,
-                    "share_value": btc_master_shares[i].share_value.hex(),
-                    "total_parties": btc_master_shares[i].total_parties,
-                    "threshold": btc_master_shares[i].threshold,
-                    "metadata": btc_master_shares[i].metadata
-                },
-                "ethereum": {
-                    "party_id": eth_master_shares[i].party_id,
-                    "share_value": eth_master_shares[i].share_value.hex(),
-                    "total_parties": eth_master_shares[i].total_parties,
-                    "threshold": eth_master_shares[i].threshold,
-                    "metadata": eth_master_shares[i].metadata
-                }
+                "bitcoin": btc_share.to_dict(),
+                "ethereum": eth_share.to_dict()
             }
         }
 
-        filename = f"party_{i+1}_shares.json"
-        with open(filename, 'w') as f:
-            json.dump(party_data, f, indent=2)
+        party_files.append((
+            f"party_{i+1}_shares.json", orjson.dumps(party_data, option=orjson.OPT_INDENT_2)
+        ))
+        parties_data.append(party_data)
 
+    # Serialize everything first, then write each file with a single write.
+    # Share files are owner-readable only.
+    for party_data, (filename, payload) in zip(parties_data, party_files):
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
         print_success(f"Saved {party_data['name']}'s shares to {filename}")
-        parties_data.append(party_data)
 
     # Generate addresses for verification
     print_info("\nGenerating Bitcoin address from public key...")
@@ -187,7 +217,7 @@ def create_vault(btc_address: str, threshold: int = 3, total_guardians: int = 3)
     }
 
     print_info("Sending vault creation request...")
-    response = requests.post(
+    response = _session.post(
         f"{COORD_SERVER_URL}/api/vaults",
         json=vault_data
     )
@@ -209,33 +239,40 @@ def create_vault(btc_address: str, threshold: int = 3, total_guardians: int = 3)
 # STEP 3: Invite Guardians
 # ==============================================================================
 
-def invite_guardians(vault_id: str, parties_data: List[Dict]):
+async def invite_guardians(vault_id: str, parties_data: List[Dict]):
     """Invite guardians to the vault"""
     print_step("3", "Inviting Guardians to Vault")
 
-    guardians = []
-    for party in parties_data:
-        print_info(f"Inviting {party['name']}...")
-
-        response = requests.post(
-            f"{COORD_SERVER_URL}/api/guardians/invite",
+    async def invite(session: aiohttp.ClientSession, party: Dict):
+        async with session.post(
+            "/api/guardians/invite",
             json={
                 "vault_id": vault_id,
                 "name": party['name'],
                 "email": f"{party['name'].lower()}@example.com",
                 "role": f"Guardian {party['party_id']}"
             }
-        )
+        ) as response:
+            if response.status in [200, 201]:
+                return await response.json()
+            print_error(f"Failed to invite {party['name']} (status {response.status}): {await response.text()}")
+            return None
 
-        if response.status_code in [200, 201]:
-            guardian = response.json()
-            guardian['party_data'] = party  # Attach the key share data
-            guardians.append(guardian)
+    # Send all invitations concurrently over one session
+    for party in parties_data:
+        print_info(f"Inviting {party['name']}...")
+    async with aiohttp.ClientSession(base_url=COORD_SERVER_URL) as session:
+        results = await asyncio.gather(*[invite(session, party) for party in parties_data])
 
-            print_success(f"  Guardian ID: {guardian['guardian_id']}")
-            print_success(f"  Invitation Code: {guardian['invitation_code']}")
-        else:
-            print_error(f"Failed to invite {party['name']} (status {response.status_code}): {response.text}")
+    guardians = []
+    for party, guardian in zip(parties_data, results):
+        if guardian is None:
+            continue
+        guardian['party_data'] = party  # Attach the key share data
+        guardians.append(guardian)
+
+        print_success(f"  Guardian ID: {guardian['guardian_id']}")
+        print_success(f"  Invitation Code: {guardian['invitation_code']}")
 
     return guardians
 
@@ -244,25 +281,27 @@ def invite_guardians(vault_id: str, parties_data: List[Dict]):
 # STEP 4: Guardians Join Vault
 # ==============================================================================
 
-def guardians_join(guardians: List[Dict]):
+async def guardians_join(guardians: List[Dict]):
     """Simulate guardians joining the vault with their invitation codes"""
     print_step("4", "Guardians Joining Vault")
 
-    for guardian in guardians:
+    async def join(session: aiohttp.ClientSession, guardian: Dict):
         print_info(f"{guardian['name']} joining with code {guardian['invitation_code']}...")
 
-        response = requests.post(
-            f"{COORD_SERVER_URL}/api/guardians/join",
+        async with session.post(
+            "/api/guardians/join",
             json={
                 "invitation_code": guardian['invitation_code'],
                 "share_id": guardian['party_data']['party_id']
             }
-        )
+        ) as response:
+            if response.status in [200, 201]:
+                print_success(f"  {guardian['name']} joined successfully")
+            else:
+                print_error(f"{guardian['name']} failed to join (status {response.status}): {await response.text()}")
 
-        if response.status_code in [200, 201]:
-            print_success(f"  {guardian['name']} joined successfully")
-        else:
-            print_error(f"Failed to join (status {response.status_code}): {response.text}")
+    async with aiohttp.ClientSession(base_url=COORD_SERVER_URL) as session:
+        await asyncio.gather(*[join(session, guardian) for guardian in guardians])
 
 
 # ==============================================================================
@@ -273,7 +312,7 @@ def activate_vault(vault_id: str):
     """Activate the vault once all guardians have joined"""
     print_step("5", "Activating Vault")
 
-    response = requests.post(
+    response = _session.post(
         f"{COORD_SERVER_URL}/api/vaults/{vault_id}/activate"
     )
 
@@ -312,7 +351,7 @@ def create_transaction(vault_id: str):
     }
 
     print_info("Creating transaction...")
-    response = requests.post(
+    response = _session.post(
         f"{COORD_SERVER_URL}/api/transactions",
         json=tx_data
     )
@@ -336,14 +375,15 @@ def create_transaction(vault_id: str):
 # ==============================================================================
 
 class GuardianSigningClient:
-    """Simulates a guardian signing via WebSocket"""
+    """Simulates a guardian signing over a GuardianMultiplexer connection"""
 
-    def __init__(self, guardian: Dict, transaction_id: str, message_hash: str):
+    def __init__(self, guardian: Dict, transaction_id: str, message_hash: str,
+                 sio: socketio.AsyncClient):
         self.guardian = guardian
         self.party_data = guardian['party_data']
         self.transaction_id = transaction_id
-        self.message_hash = message_hash
-        self.vault_id = guardian['vault_id']
+        # Decode the message hash once; Round 3 signs over the raw bytes
+        self.message_hash_bytes = bytes.fromhex(message_hash)
 
         # Load the Bitcoin key share for signing
         btc_share_data = self.party_data['master_shares']['bitcoin']
@@ -358,69 +398,52 @@ class GuardianSigningClient:
         # Store nonce for Round 3
         self.nonce_share = None
 
-        # Socket.IO client
-        self.sio = socketio.AsyncClient()
-        self.setup_handlers()
+        # Shared Socket.IO client; the GuardianMultiplexer owns the
+        # connection and dispatches server events to this client
+        self.sio = sio
 
         # State
         self.round1_complete = False
         self.round2_complete = False
         self.round3_complete = False
-        self.signing_complete = False
-
-    def setup_handlers(self):
-        """Setup WebSocket event handlers"""
-
-        @self.sio.event
-        async def connect():
-            print_success(f"  {self.guardian['name']} connected to server")
-
-        @self.sio.event
-        async def disconnect():
-            print_info(f"  {self.guardian['name']} disconnected")
-
-        @self.sio.on('signing:round2_ready')
-        async def on_round2_ready(data):
-            print_info(f"  {self.guardian['name']} received signing:round2_ready event: {data}")
-            tx_id = data.get('transactionId') or data.get('transaction_id')
-            if tx_id == self.transaction_id:
-                print_success(f"  {self.guardian['name']} Round 2 ready - executing Round 3")
+        self.round3_finished = asyncio.Event()
+        self.signing_complete = asyncio.Event()
+
+    async def on_round2_ready(self, data: Dict):
+        """Handle signing:round2_ready by running Round 3"""
+        print_info(f"  {self.guardian['name']} received signing:round2_ready event: {data}")
+        if self._is_own_transaction(data):
+            print_success(f"  {self.guardian['name']} Round 2 ready - executing Round 3")
+            try:
                 await self.execute_round3()
-            else:
-                print_error(f"  {self.guardian['name']} Transaction ID mismatch: expected {self.transaction_id}, got {tx_id}")
-
-        @self.sio.on('signing:complete')
-        async def on_signing_complete(data):
-            print_info(f"  {self.guardian['name']} received signing:complete event: {data}")
-            tx_id = data.get('transactionId') or data.get('transaction_id')
-            if tx_id == self.transaction_id:
-                print_success(f"  {self.guardian['name']} Signing complete!")
-                self.signing_complete = True
-            else:
-                print_error(f"  {self.guardian['name']} Transaction ID mismatch: expected {self.transaction_id}, got {tx_id}")
-
-        @self.sio.on('*')
-        async def catch_all(event, data):
-            print_info(f"  {self.guardian['name']} received event '{event}': {data}")
-
-    async def connect(self):
-        """Connect to coordination server"""
-        await self.sio.connect(
-            COORD_SERVER_URL,
-            auth={
-                'vaultId': self.vault_id,
-                'guardianId': self.guardian['guardian_id']
-            },
-            transports=['websocket']
-        )
+            finally:
+                self.round3_finished.set()
+
+    async def on_signing_complete(self, data: Dict):
+        """Handle signing:complete"""
+        print_info(f"  {self.guardian['name']} received signing:complete event: {data}")
+        if self._is_own_transaction(data):
+            print_success(f"  {self.guardian['name']} Signing complete!")
+            self.signing_complete.set()
+
+    def _is_own_transaction(self, data: Dict) -> bool:
+        """Check that a server event refers to this client's transaction"""
+        # The server sends transaction_id; transactionId is accepted as well
+        tx_id = data.get('transaction_id') or data.get('transactionId')
+        if tx_id == self.transaction_id:
+            return True
+        print_error(f"  {self.guardian['name']} Transaction ID mismatch: expected {self.transaction_id}, got {tx_id}")
+        return False
 
     async def execute_round1(self):
         """Execute Round 1: Generate nonce share and R point"""
         print_info(f"  {self.guardian['name']} executing Round 1...")
 
-        # Generate nonce and R point using static method
-        self.nonce_share, r_point_bytes = MPCSigner.sign_round1_generate_nonce(
-            self.key_share.party_id
+        # Generate nonce and R point using static method. The k*G scalar
+        # multiplication runs in a worker thread so it does not stall the
+        # Socket.IO event loop (it takes milliseconds without coincurve)
+        self.nonce_share, r_point_bytes = await asyncio.to_thread(
+            MPCSigner.sign_round1_generate_nonce, self.key_share.party_id
         )
 
         # Submit to server
@@ -429,8 +452,8 @@ class GuardianSigningClient:
             {
                 'transactionId': self.transaction_id,
                 'guardianId': self.guardian['guardian_id'],
-                'nonceShare': self.nonce_share.to_bytes(32, 'big').hex(),
-                'rPoint': r_point_bytes.hex()
+                'nonceShare': self.nonce_share.to_bytes(32, 'big'),
+                'rPoint': r_point_bytes
             }
         )
 
@@ -462,11 +485,10 @@ class GuardianSigningClient:
         r = round2_data['r']
 
         # Compute signature share using static method
-        message_hash_bytes = bytes.fromhex(self.message_hash)
         sig_share = MPCSigner.sign_round3_compute_signature_share(
             key_share=self.key_share,
             nonce_share=self.nonce_share,
-            message_hash=message_hash_bytes,
+            message_hash=self.message_hash_bytes,
             r=r,
             k_total=k_total,
             num_parties=self.key_share.total_parties
@@ -488,6 +510,63 @@ class GuardianSigningClient:
         else:
             print_error(f"    Round 3 failed: {response.get('error')}")
 
+
+class GuardianMultiplexer:
+    """Carries the signing traffic of several guardians over one WebSocket
+
+    The server accepts a guardianIds list at connect time and checks the
+    guardianId named in each signing event, so a single connection can act
+    for every guardian in the vault.
+    """
+
+    def __init__(self, guardians: List[Dict], transaction_id: str, message_hash: str):
+        self.vault_id = guardians[0]['vault_id']
+        self.sio = socketio.AsyncClient()
+        self.clients = [
+            GuardianSigningClient(guardian, transaction_id, message_hash, sio=self.sio)
+            for guardian in guardians
+        ]
+        self.connected = asyncio.Event()
+        self.setup_handlers()
+
+    def setup_handlers(self):
+        """Setup WebSocket event handlers and fan events out to the guardians"""
+
+        @self.sio.event
+        async def connect():
+            for client in self.clients:
+                print_success(f"  {client.guardian['name']} connected to server")
+            self.connected.set()
+
+        @self.sio.event
+        async def disconnect():
+            print_info(f"  {len(self.clients)} guardians disconnected")
+
+        @self.sio.on('signing:round2_ready')
+        async def on_round2_ready(data):
+            await asyncio.gather(*[client.on_round2_ready(data) for client in self.clients])
+
+        @self.sio.on('signing:complete')
+        async def on_signing_complete(data):
+            for client in self.clients:
+                await client.on_signing_complete(data)
+
+        if DEBUG_EVENTS:
+            @self.sio.on('*')
+            async def catch_all(event, data):
+                print_info(f"  Guardians received event '{event}': {data}")
+
+    async def connect(self):
+        """Connect all guardians to the coordination server"""
+        await self.sio.connect(
+            COORD_SERVER_URL,
+            auth={
+                'vaultId': self.vault_id,
+                'guardianIds': [client.guardian['guardian_id'] for client in self.clients]
+            },
+            transports=['websocket']
+        )
+
     async def disconnect(self):
         """Disconnect from server"""
         await self.sio.disconnect()
@@ -497,20 +576,18 @@ async def guardians_sign_transaction(guardians: List[Dict], transaction: Dict):
     """Simulate all guardians signing the transaction"""
     print_step("7", "Guardians Signing Transaction (4-Round MPC)")
 
-    # Create signing clients for each guardian
-    clients = []
-    for guardian in guardians:
-        client = GuardianSigningClient(
-            guardian=guardian,
-            transaction_id=transaction['transaction_id'],
-            message_hash=transaction['message_hash']
-        )
-        clients.append(client)
+    # Create signing clients for each guardian, sharing one connection
+    multiplexer = GuardianMultiplexer(
+        guardians=guardians,
+        transaction_id=transaction['transaction_id'],
+        message_hash=transaction['message_hash']
+    )
+    clients = multiplexer.clients
 
     # Connect all guardians
     print_info("Connecting guardians to server...")
-    await asyncio.gather(*[client.connect() for client in clients])
-    await asyncio.sleep(1)  # Give connections time to establish
+    await multiplexer.connect()
+    await multiplexer.connected.wait()
 
     # Round 1: All guardians generate and submit nonce shares
     print_info("\n[Round 1] Guardians generating nonce shares...")
@@ -521,25 +598,26 @@ async def guardians_sign_transaction(guardians: List[Dict], transaction: Dict):
 
     # Wait up to 30 seconds for signing to complete
     max_wait = 30
-    waited = 0
-    while waited < max_wait:
-        if all(client.signing_complete for client in clients):
-            print_success(f"\nAll guardians completed signing after {waited}s")
-            break
-        await asyncio.sleep(1)
-        waited += 1
-
-    if not all(client.signing_complete for client in clients):
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*[client.signing_complete.wait() for client in clients]),
+            timeout=max_wait
+        )
+        print_success(f"\nAll guardians completed signing after {loop.time() - started:.1f}s")
+
+        # The last Round 3 acknowledgement can arrive after signing:complete;
+        # let every guardian finish Round 3 before disconnecting
+        await asyncio.gather(*[client.round3_finished.wait() for client in clients])
+    except asyncio.TimeoutError:
         print_error(f"\nWarning: Not all guardians completed signing after {max_wait}s")
         for client in clients:
-            if not client.signing_complete:
-                print_error(f"  {client.guardian['name']}: Round1={client.round1_complete}, Round3={client.round3_complete}, Complete={client.signing_complete}")
-
-    # Give a moment for any final events
-    await asyncio.sleep(2)
+            if not client.signing_complete.is_set():
+                print_error(f"  {client.guardian['name']}: Round1={client.round1_complete}, Round3={client.round3_complete}, Complete={client.signing_complete.is_set()}")
 
     # Disconnect all clients
-    await asyncio.gather(*[client.disconnect() for client in clients])
+    await multiplexer.disconnect()
 
     print_success("\nGuardians disconnected")
 
@@ -552,7 +630,7 @@ def get_final_signature(transaction_id: str):
     """Retrieve the final signature from the server"""
     print_step("8", "Retrieving Final Signature")
 
-    response = requests.get(
+    response = _session.get(
         f"{COORD_SERVER_URL}/api/transactions/{transaction_id}"
     )
 
@@ -599,7 +677,7 @@ async def main():
 
     try:
         # Step 1: Generate key shares
-        parties_data, btc_address = generate_key_shares(num_parties=3, threshold=3)
+        parties_data, btc_address = await generate_key_shares(num_parties=3, threshold=3)
 
         # Step 2: Create vault
         vault = create_vault(btc_address, threshold=3, total_guardians=3)
@@ -607,10 +685,10 @@ async def main():
             return
 
         # Step 3: Invite guardians
-        guardians = invite_guardians(vault['vault_id'], parties_data)
+        guardians = await invite_guardians(vault['vault_id'], parties_data)
 
         # Step 4: Guardians join
-        guardians_join(guardians)
+        await guardians_join(guardians)
 
         # Step 5: Activate vault
         activated_vault = activate_vault(vault['vault_id'])
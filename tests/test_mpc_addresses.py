@@ -0,0 +1,141 @@
+"""
+Tests for guardianvault.mpc_addresses
+
+Covers the EIP-55 checksum against the reference vectors, the pure-Python
+fallbacks used when the optional based58/coincurve backends are missing,
+and the AddressRecord / iterator API.
+"""
+
+import pytest
+
+from guardianvault import mpc_addresses
+from guardianvault.enhanced_crypto_mpc import EthereumAddress
+from guardianvault.mpc_addresses import (
+    AddressRecord,
+    BitcoinAddressGenerator,
+    EthereumAddressGenerator,
+)
+from guardianvault.mpc_keymanager import ExtendedPublicKey
+
+
+# Reference vectors from the EIP-55 specification
+EIP55_VECTORS = [
+    "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+    "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+    "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+]
+
+# Public key of private key 1 (the secp256k1 generator point)
+GENERATOR_PUBKEY = bytes.fromhex(
+    "0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+)
+GENERATOR_BTC_ADDRESS = "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH"
+GENERATOR_ETH_ADDRESS = "0x7E5F4552091A69125d5DfCb7b8C2659029395Bdf"
+
+
+@pytest.fixture
+def xpub():
+    return ExtendedPublicKey(
+        public_key=bytes.fromhex(
+            "0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c2"
+        ),
+        chain_code=bytes.fromhex(
+            "873dff81c02f525623fd1fe5167eac3a55a049de3d314bb42ee227ffed37d508"
+        ),
+        depth=3,
+        parent_fingerprint=b"\x00" * 4,
+        child_number=0,
+    )
+
+
+@pytest.mark.parametrize("address", EIP55_VECTORS)
+def test_eip55_checksum_generator(address):
+    assert EthereumAddressGenerator._apply_eip55_checksum(address.lower()) == address
+
+
+@pytest.mark.parametrize("address", EIP55_VECTORS)
+def test_eip55_checksum_enhanced_crypto(address):
+    assert EthereumAddress.checksum_address(address.lower()) == address
+
+
+@pytest.mark.parametrize("network", ["mainnet", "testnet", "regtest"])
+def test_base58_fallback_matches_native(monkeypatch, network):
+    native = BitcoinAddressGenerator.pubkey_to_address(GENERATOR_PUBKEY, network=network)
+
+    monkeypatch.setattr(mpc_addresses, "_b58encode", None)
+    monkeypatch.setattr(mpc_addresses, "_b58encode_check", None)
+    fallback = BitcoinAddressGenerator.pubkey_to_address(GENERATOR_PUBKEY, network=network)
+
+    assert fallback == native
+    if network == "mainnet":
+        assert fallback == GENERATOR_BTC_ADDRESS
+
+
+def test_base58_fallback_leading_zeros(monkeypatch):
+    monkeypatch.setattr(mpc_addresses, "_b58encode", None)
+    assert BitcoinAddressGenerator._base58_encode(b"\x00\x00\x01") == "112"
+
+
+def test_decompression_fallback(monkeypatch):
+    native = EthereumAddressGenerator.pubkey_to_address(GENERATOR_PUBKEY)
+
+    monkeypatch.setattr(mpc_addresses, "_SecpPublicKey", None)
+    fallback = EthereumAddressGenerator.pubkey_to_address(GENERATOR_PUBKEY)
+
+    assert fallback == native == GENERATOR_ETH_ADDRESS
+
+
+def test_decompression_fallback_odd_y(monkeypatch, xpub):
+    # Exercise the 0x03 prefix too
+    native = EthereumAddressGenerator.pubkey_to_address(xpub.public_key)
+
+    monkeypatch.setattr(mpc_addresses, "_SecpPublicKey", None)
+    assert EthereumAddressGenerator.pubkey_to_address(xpub.public_key) == native
+
+
+@pytest.mark.parametrize("address_type", ["p2pkh", "p2wpkh", "p2tr"])
+def test_bitcoin_iter_matches_generate(xpub, address_type):
+    kwargs = dict(change=0, start_index=5, count=8, network="testnet", address_type=address_type)
+    assert (
+        list(BitcoinAddressGenerator.iter_addresses_from_xpub(xpub, **kwargs))
+        == BitcoinAddressGenerator.generate_addresses_from_xpub(xpub, **kwargs)
+    )
+
+
+def test_ethereum_iter_matches_generate(xpub):
+    kwargs = dict(change=1, start_index=0, count=8)
+    assert (
+        list(EthereumAddressGenerator.iter_addresses_from_xpub(xpub, **kwargs))
+        == EthereumAddressGenerator.generate_addresses_from_xpub(xpub, **kwargs)
+    )
+
+
+def test_address_record_key_access(xpub):
+    record = BitcoinAddressGenerator.generate_addresses_from_xpub(xpub, count=1)[0]
+
+    assert isinstance(record, AddressRecord)
+    assert record["path"] == record.path == "m/44'/0'/0'/0/0"
+    assert record["address"] == record.address
+    assert record["address_type"] == "p2pkh"
+    assert record["public_key"] == record.public_key
+    assert isinstance(record.public_key, bytes)
+    assert record.public_key_hex == record.public_key.hex()
+    # Integer indexing still works as for any tuple
+    assert record[0] == record.path
+
+
+def test_address_record_unknown_key(xpub):
+    record = EthereumAddressGenerator.generate_addresses_from_xpub(xpub, count=1)[0]
+
+    assert record.address_type is None
+    with pytest.raises(KeyError):
+        record["missing"]
+
+
+@pytest.mark.parametrize("key", ["count", "index", "_asdict", "public_key_hex"])
+def test_address_record_non_field_key(xpub, key):
+    record = BitcoinAddressGenerator.generate_addresses_from_xpub(xpub, count=1)[0]
+
+    with pytest.raises(KeyError):
+        record[key]